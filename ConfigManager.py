@@ -1,5 +1,70 @@
 import json
 import os
+import stat
+import tempfile
+
+# orjson is optional, it is only a faster drop-in for the stdlib json module here.
+# Both backends (de)serialize UTF-8 bytes the same way: 2-space indent, non-ASCII kept as-is,
+# a BOM or invalid UTF-8 is rejected. orjson.JSONDecodeError subclasses json.JSONDecodeError.
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    def _loads(data: bytes):
+        # Decode strictly like orjson, json.loads(bytes) would silently skip a BOM
+        return json.loads(data.decode("utf-8"))
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+_DEFAULT_CONFIG = {
+    "font_file": "fonts/serif.ttf",
+    "font_file_2": "fonts/sans.ttf",
+    "logo_file": "logo/logo.png",
+    "resize_scale": 2,
+    "avoid_leading": True,
+    "avoid_ending": True,
+    "grid_size": (4, 4)
+}
+_DEFAULT_CONFIG_BYTES = _dumps(_DEFAULT_CONFIG)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """
+    Write bytes to a file through a uniquely named temporary sibling, flushed
+    to disk before `os.replace`, so readers never observe a partially written file.
+    The temporary file is removed if anything fails before the replace.
+
+    Args:
+        path (str): Destination file path.
+        data (bytes): Content to write.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file as 0600, give it the mode a plain open() would have kept
+        if os.path.exists(path):
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
 
 
 class ConfigManager:
@@ -24,6 +89,17 @@ class ConfigManager:
         grid_size (tuple[int, int]): Grid size configuration.
     """
 
+    __slots__ = (
+        "config_file",
+        "font_file",
+        "font_file_2",
+        "logo_file",
+        "resize_scale",
+        "avoid_leading",
+        "avoid_ending",
+        "grid_size",
+    )
+
     def __init__(self, config_file: str) -> None:
         """
         Initializes the ConfigManager with the path to the config file.
@@ -63,18 +139,7 @@ class ConfigManager:
         Create the default configuration file with predefined settings.
         Called when the config file is missing.
         """
-        default_config = {
-            "font_file": "fonts/serif.ttf",
-            "font_file_2": "fonts/sans.ttf",
-            "logo_file": "logo/logo.png",
-            "resize_scale": 2,
-            "avoid_leading": True,
-            "avoid_ending": True,
-            "grid_size": (4, 4)
-        }
-
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=4)
+        _atomic_write(self.config_file, _DEFAULT_CONFIG_BYTES)
         print(f"Default config file created at {self.config_file}.")
 
     def _load_config(self) -> None:
@@ -90,17 +155,19 @@ class ConfigManager:
         if not os.path.exists(self.config_file):
             raise FileNotFoundError(f"Config file {self.config_file} not found.")
 
-        with open(self.config_file, 'r', encoding='utf-8') as f:
+        with open(self.config_file, 'rb') as f:
             try:
-                config = json.load(f)
-                # Assign each config value to its respective instance variable
-                self.font_file = config.get("font_file", "fonts/serif.ttf")
-                self.font_file_2 = config.get("font_file_2", "fonts/sans.ttf")
-                self.logo_file = config.get("logo_file", "logo/logo.png")
-                self.resize_scale = config.get("resize_scale", 2)
-                self.avoid_leading = config.get("avoid_leading", True)
-                self.avoid_ending = config.get("avoid_ending", True)
-                self.grid_size = tuple(config.get("grid_size", (4, 4)))
+                config = _loads(f.read())
+                # Fill missing keys from the defaults, then assign each value to its instance variable
+                merged = {**_DEFAULT_CONFIG, **config}
+                self.font_file = merged["font_file"]
+                self.font_file_2 = merged["font_file_2"]
+                self.logo_file = merged["logo_file"]
+                self.resize_scale = merged["resize_scale"]
+                self.avoid_leading = merged["avoid_leading"]
+                self.avoid_ending = merged["avoid_ending"]
+                grid_size = merged["grid_size"]
+                self.grid_size = grid_size if type(grid_size) is tuple else tuple(grid_size)
 
                 # Validate the file paths for font and logo files
                 if not os.path.exists(self.font_file):
@@ -110,7 +177,7 @@ class ConfigManager:
                 if not os.path.exists(self.logo_file):
                     raise FileNotFoundError(f"Logo file not found at {self.logo_file}")
 
-            except json.JSONDecodeError:
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 raise ValueError(f"Failed to decode JSON from {self.config_file}.")
 
     def update(self, key: str, value) -> bool:
@@ -144,6 +211,5 @@ class ConfigManager:
             "grid_size": self.grid_size
         }
 
-        with open(self.config_file, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=4)
+        _atomic_write(self.config_file, _dumps(config))
         print(f"Config file saved at {self.config_file}.")
@@ -1,4 +1,3 @@
-import copy
 import io
 import json
 import math
@@ -200,7 +199,7 @@ def get_video_info(file_path: str) -> Optional[VideoInfo]:
                 # if isinstance(tags := stream.get("tags", {}), dict):
                 #     video_info["lang"] = tags.get("language", "N/A")
 
-                video_info_ld.append(copy.deepcopy(video_info))
+                video_info_ld.append(video_info.copy())
                 # In the case of other video streams, the other keys are overwritten,
                 # but not necessarily for the "lang" item
                 # video_info["lang"] = ""
@@ -273,6 +272,24 @@ def calculate_snapshot_times(video_info: VideoInfo, avoid_leading: bool = True,
     return snapshot_times
 
 
+def _resize_image(image: ImageType, size: Tuple[int, int]) -> ImageType:
+    """
+    Resize an image with Lanczos, skipping the work when the size is unchanged.
+
+    Args:
+        image (ImageType): The image to resize.
+        size (Tuple[int, int]): Target (width, height).
+
+    Returns:
+        ImageType: The resized image, or `image` itself if it already has the target size.
+    """
+
+    if image.size == size:
+        return image
+
+    return image.resize(size, Resampling.LANCZOS)
+
+
 def take_snapshots(video_info: VideoInfo, snapshot_times, target_width=0, target_height=0, scale_method="fit") -> List[ImageType]:
     """
     Capture snapshots from a video at specified times, scaling each snapshot to the desired target dimensions.
@@ -341,8 +358,7 @@ def take_snapshots(video_info: VideoInfo, snapshot_times, target_width=0, target
                 scale_width, scale_height = (math.floor(
                     scale_factor*width), math.floor(scale_factor*height))
 
-                image = image.resize(
-                    (scale_width, scale_height), Resampling.LANCZOS)
+                image = _resize_image(image, (scale_width, scale_height))
 
                 left = int((target_width - scale_width) // 2)
                 top = int((target_height - scale_height) // 2)
@@ -352,16 +368,14 @@ def take_snapshots(video_info: VideoInfo, snapshot_times, target_width=0, target
                     image, (left, top, right, bottom), fill='black')
 
             elif scale_method == "stretch":
-                image = image.resize(
-                    (target_width, target_height), Resampling.LANCZOS)
+                image = _resize_image(image, (target_width, target_height))
 
             elif scale_method == "crop":
                 scale_factor = max(target_width/width, target_height/height)
                 scale_width, scale_height = (
                     math.ceil(scale_factor*width), math.ceil(scale_factor*height))
 
-                image = image.resize(
-                    (scale_width, scale_height), Resampling.LANCZOS)
+                image = _resize_image(image, (scale_width, scale_height))
 
                 left = int((target_width - scale_width) // 2)
                 top = int((target_height - scale_height) // 2)
@@ -405,8 +419,15 @@ def multiline_text_with_shade(
 
     x, y = pos
     dx, dy = offset
-    draw_obj.multiline_text((x+dx, y+dy), text, fill=shade_color, font=font, spacing=spacing)
-    draw_obj.multiline_text((x, y), text, fill=text_color, font=font, spacing=spacing)
+    # Rasterize the glyphs once into a coverage mask, then stamp it twice (shade, then text)
+    left, top, right, bottom = draw_obj.multiline_textbbox((0, 0), text, font=font, spacing=spacing)
+    if right <= left or bottom <= top:
+        return None
+
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).multiline_text((-left, -top), text, fill=255, font=font, spacing=spacing)
+    draw_obj.bitmap((x + dx + left, y + dy + top), mask, fill=shade_color)
+    draw_obj.bitmap((x + left, y + top), mask, fill=text_color)
 
     return None
 
@@ -425,7 +446,8 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         logofile (str): Path to the logo image file to place in the top-right corner.
 
     Raises:
-        ValueError: If the number of `images` does not match the required number based on `grid`.
+        ValueError: If the number of `images` does not match the required number based on `grid`,
+                    or if `snapshottimes` has fewer entries than `images`.
 
     Returns:
         ImageType: A PIL Image object of the completed scan image, with:
@@ -448,6 +470,9 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
     if len(images) != total_images:
         raise ValueError(
             f"Image count ({len(images)}) does not match the grid count ({total_images}).")
+    if len(snapshottimes) < total_images:
+        raise ValueError(
+            f"Snapshot time count ({len(snapshottimes)}) is less than the image count ({total_images}).")
 
     # The width is directly associated with drawing information,
     # should not be variable before the info grid become flexible.
@@ -465,9 +490,11 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
     shade_offset = (2, 2)
     text_color = (0, 0, 0)
     shade_color = (49, 49, 49)
+    # Resolve each section once, `VideoInfo.__getitem__` rebuilds every section on each call
+    file_section, video_section, audio_section, subtitle_section = (video_info[key] for key in ("F", "V", "A", "S"))
     text_list = [
         [
-            video_info["F"]["name"],
+            file_section["name"],
         ],
         [
             "　　　　【文件信息】",
@@ -477,9 +504,9 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         ],
         [
             "",
-            video_info["F"]["size"],
-            video_info["F"]["duration"],
-            video_info["F"]["bitrate"],
+            file_section["size"],
+            file_section["duration"],
+            file_section["bitrate"],
         ],
         [
             "　　　　【视频信息】",
@@ -490,10 +517,10 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         ],
         [
             "",
-            video_info["V"]["codec"],
-            video_info["V"]["color"],
-            video_info["V"]["frameSize"],
-            video_info["V"]["frameRate"],
+            video_section["codec"],
+            video_section["color"],
+            video_section["frameSize"],
+            video_section["frameRate"],
         ],
         [
             "　　　　【音频信息】",
@@ -504,10 +531,10 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         ],
         [
             "",
-            video_info["A"]["codec"],
-            video_info["A"]["lang"],
-            video_info["A"]["title"],
-            video_info["A"]["channel"],
+            audio_section["codec"],
+            audio_section["lang"],
+            audio_section["title"],
+            audio_section["channel"],
         ],
         [
             "　　　【字幕信息】",
@@ -517,9 +544,9 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         ],
         [
             "",
-            video_info["S"]["codec"],
-            video_info["S"]["lang"],
-            video_info["S"]["title"],
+            subtitle_section["codec"],
+            subtitle_section["lang"],
+            subtitle_section["title"],
         ],
     ]
     pos_list = [
@@ -535,28 +562,31 @@ def create_scan_image(images: List[ImageType], grid: Tuple[int, int], snapshotti
         multiline_text_with_shade(draw, "\n".join(i), j, shade_offset, spacing, k, text_color, shade_color)
 
     y_offset = 450
-    for idx, image in enumerate(images):
+    # Loop invariants, built once instead of per snapshot
+    image_size = (image_width, image_height)
+    timestamp_bg_color = (0, 0, 0, int(255 * 0.6))
+    timestamp_color = (255, 255, 255, int(255 * 0.6))
+
+    for idx, (image, snap_at) in enumerate(zip(images, snapshottimes)):
 
         grid_x = (idx % col) * image_width
         grid_y = (idx // col) * image_height + y_offset
 
-        image_resized = image.resize((image_width, image_height), Resampling.LANCZOS)
-        scan_image.paste(image_resized, (grid_x, grid_y))
+        scan_image.paste(_resize_image(image, image_size), (grid_x, grid_y))
 
-        snapshot_time = str(timedelta(seconds=snapshottimes[idx]))
-        text_bbox = draw.textbbox((0, 0), snapshot_time, font=font_2)
-        text_width = text_bbox[2] - text_bbox[0]
-        text_height = text_bbox[3] - text_bbox[1]
+        snapshot_time = str(timedelta(seconds=snap_at))
+        # Measure on the font directly, no need to route through the canvas' ImageDraw
+        left, top, right, bottom = font_2.getbbox(snapshot_time)
+        text_width = right - left
+        text_height = bottom - top
         timestamp_x = grid_x + (image_width - text_width) // 2
         timestamp_y = grid_y - (text_height // 2) + 10
 
-        background = Image.new(
-            "RGBA", (text_width, text_height), (0, 0, 0, int(255 * 0.6)))
+        background = Image.new("RGBA", (text_width, text_height), timestamp_bg_color)
         scan_image.paste(background, (timestamp_x, timestamp_y+14), background)
-        draw.text((timestamp_x, timestamp_y), snapshot_time,
-                  fill=(255, 255, 255, int(255 * 0.6)), font=font_2)
+        draw.text((timestamp_x, timestamp_y), snapshot_time, fill=timestamp_color, font=font_2)
 
-    logo = Image.open(logofile).resize((405, 405), Resampling.LANCZOS)
+    logo = _resize_image(Image.open(logofile), (405, 405))
 
     logo_x = scan_image.width - logo.width - 22
     logo_y = 22
@@ -653,7 +683,7 @@ def main():
                                      video_info, font_file, font_file_2, logo_file)
 
             w, h = scan.size
-            scan = scan.resize((w//resize_scale, h//resize_scale), Resampling.LANCZOS)
+            scan = _resize_image(scan, (w//resize_scale, h//resize_scale))
             scan.save(f"scans/{datetime.now().strftime('%H%M%S')}.scan.{video_info.file_name}.png")
 
         else: